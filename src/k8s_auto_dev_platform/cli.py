@@ -7,8 +7,52 @@ import sys
 from pathlib import Path
 from typing import Any, Mapping
 
+try:
+    import yaml as _yaml  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _yaml = None
+    _YAML_LOADER = None
+else:
+    # Prefer the LibYAML-backed loader; it parses bytes directly and is much faster.
+    _YAML_LOADER = getattr(_yaml, "CSafeLoader", _yaml.SafeLoader)
+
 from .orchestrator import K8sAutoDevPlatform
 from .template_manager import TemplateManager
+from .utils import cache_enabled
+
+
+def _load_yaml_requirements(path: Path) -> Any:
+    """Parse a YAML requirements file, reusing a sibling JSON cache when enabled.
+
+    Setting ``K8S_AUTODEV_CACHE=1`` stores the parsed document next to the source
+    as ``<name>.cache.json`` and reads it back while it is not older than the YAML.
+    Documents that JSON cannot reproduce exactly (e.g. integer keys) are not cached.
+    """
+    cache_path: Path | None = None
+    if cache_enabled():
+        cache_path = path.with_suffix(path.suffix + ".cache.json")
+        try:
+            if cache_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                with cache_path.open("rb") as handle:
+                    return json.load(handle)
+        except (OSError, ValueError):
+            pass
+
+    if _yaml is None:  # pragma: no cover - optional dependency
+        raise RuntimeError("PyYAML is required to read YAML requirement files.")
+    with path.open("rb") as handle:
+        data = _yaml.load(handle, Loader=_YAML_LOADER)
+
+    if cache_path is not None:
+        try:
+            encoded = json.dumps(data, ensure_ascii=False)
+            # JSON stringifies non-string keys and turns tuples into lists; only cache
+            # documents that read back identically.
+            if json.loads(encoded) == data:
+                cache_path.write_text(encoded, encoding="utf-8")
+        except (OSError, TypeError, ValueError):  # pragma: no cover - cache is best effort
+            pass
+    return data
 
 
 def _load_requirements(path: Path) -> Mapping[str, Any]:
@@ -16,12 +60,7 @@ def _load_requirements(path: Path) -> Mapping[str, Any]:
         raise FileNotFoundError(f"Requirements file not found: {path}")
 
     if path.suffix.lower() in {".yaml", ".yml"}:
-        try:
-            import yaml  # type: ignore
-        except ImportError as exc:  # pragma: no cover - optional dependency
-            raise RuntimeError("PyYAML is required to read YAML requirement files.") from exc
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        data = _load_yaml_requirements(path)
     else:
         with path.open("r", encoding="utf-8") as handle:
             data = json.load(handle)
@@ -1,14 +1,17 @@
 """Kubernetes deployment helpers."""
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Literal, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeploymentResult:
     """Outcome of applying Kubernetes manifests for a project."""
 
@@ -16,17 +19,73 @@ class DeploymentResult:
     manifest_files: list[str]
     message: str
     command_sequence: list[Sequence[str]]
+    plan_text: str | None = None
+
+
+@lru_cache(maxsize=None)
+def _default_kubectl() -> str | None:
+    """Locate kubectl on ``PATH`` once per process."""
+    return shutil.which("kubectl")
+
+
+def _list_manifests(manifest_dir: Path) -> list[Path]:
+    """Return the ``*.yaml`` files directly inside *manifest_dir*, sorted by name."""
+    try:
+        with os.scandir(manifest_dir) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [manifest_dir / name for name in names]
 
 
 class KubernetesDeployer:
-    """Apply Kubernetes manifests using the local kubectl binary when available."""
+    """Apply Kubernetes manifests using the local kubectl binary when available.
+
+    Without kubectl a dry-run plan is produced instead. ``plan_sink="disk"`` writes
+    it to ``k8s/deployment-plan.txt``; ``"memory"`` only returns it on the result.
+    """
 
-    def __init__(self, kubectl_path: str | None = None) -> None:
-        self._kubectl = kubectl_path or shutil.which("kubectl")
+    def __init__(
+        self, kubectl_path: str | None = None, plan_sink: Literal["disk", "memory"] = "disk"
+    ) -> None:
+        if plan_sink not in ("disk", "memory"):
+            raise ValueError(f"Unsupported plan sink '{plan_sink}'. Allowed: disk, memory")
+        self._kubectl = kubectl_path or _default_kubectl()
+        self._plan_sink = plan_sink
 
     def deploy(self, project_path: Path, namespace: str | None = None) -> DeploymentResult:
+        prepared = self._prepare(project_path, namespace)
+        if isinstance(prepared, DeploymentResult):
+            return prepared
+        command, manifest_paths = prepared
+        completed = subprocess.run(command, capture_output=True, check=False)
+        return self._finish(command, manifest_paths, completed.returncode, completed.stdout, completed.stderr)
+
+    async def deploy_async(self, project_path: Path, namespace: str | None = None) -> DeploymentResult:
+        """Asynchronous variant of :meth:`deploy` that awaits kubectl without blocking."""
+        prepared = self._prepare(project_path, namespace)
+        if isinstance(prepared, DeploymentResult):
+            return prepared
+        command, manifest_paths = prepared
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        assert process.returncode is not None  # set once communicate() has returned
+        return self._finish(command, manifest_paths, process.returncode, stdout, stderr)
+
+    def _prepare(
+        self, project_path: Path, namespace: str | None
+    ) -> DeploymentResult | tuple[list[str], list[str]]:
+        """Return the kubectl command to run, or a final result when nothing can be applied."""
         manifest_dir = project_path / "k8s"
-        manifest_files = sorted(manifest_dir.glob("*.yaml"))
+        manifest_files = _list_manifests(manifest_dir)
         manifest_paths = [str(path) for path in manifest_files]
 
         if not manifest_files:
@@ -38,34 +97,55 @@ class KubernetesDeployer:
             )
 
         if not self._kubectl:
-            plan_path = manifest_dir / "deployment-plan.txt"
             summary_lines = [
                 "kubectl command not found; generated dry-run deployment plan.",
                 "Apply the following manifests manually:",
             ] + manifest_paths
-            plan_path.write_text("\n".join(summary_lines) + "\n", encoding="utf-8")
+            plan_text = "\n".join(summary_lines) + "\n"
+            if self._plan_sink == "memory":
+                message = "kubectl not available. Plan returned in memory."
+            else:
+                plan_path = manifest_dir / "deployment-plan.txt"
+                plan_path.write_text(plan_text, encoding="utf-8")
+                message = f"kubectl not available. Plan written to {plan_path}."
             return DeploymentResult(
                 applied=False,
                 manifest_files=manifest_paths,
-                message=f"kubectl not available. Plan written to {plan_path}.",
+                message=message,
                 command_sequence=[],
+                plan_text=plan_text,
             )
 
-        executed_commands: list[Sequence[str]] = []
-        for manifest in manifest_files:
-            command: list[str] = [self._kubectl, "apply", "-f", str(manifest)]
-            if namespace:
-                command.extend(["-n", namespace])
-            completed = subprocess.run(command, capture_output=True, text=True, check=False)
-            executed_commands.append(command)
-            if completed.returncode != 0:
-                message = (completed.stderr or completed.stdout or "Unknown kubectl error").strip()
-                return DeploymentResult(
-                    applied=False,
-                    manifest_files=manifest_paths,
-                    message=f"kubectl failed for {manifest}: {message}",
-                    command_sequence=executed_commands,
-                )
+        # A single kubectl invocation amortises its startup and kubeconfig loading
+        # across all manifests.
+        command: list[str] = [self._kubectl, "apply"]
+        for manifest in manifest_paths:
+            command.extend(["-f", manifest])
+        if namespace:
+            command.extend(["-n", namespace])
+        return command, manifest_paths
+
+    def _finish(
+        self,
+        command: list[str],
+        manifest_paths: list[str],
+        return_code: int,
+        stdout: bytes,
+        stderr: bytes,
+    ) -> DeploymentResult:
+        executed_commands: list[Sequence[str]] = [command]
+        if return_code != 0:
+            # kubectl output is only decoded when it is reported back to the user.
+            output = (stderr or stdout).decode("utf-8", errors="replace")
+            message = output.strip() or "Unknown kubectl error"
+            failed = [path for path in manifest_paths if path in message]
+            target = ", ".join(failed) if failed else "manifests"
+            return DeploymentResult(
+                applied=False,
+                manifest_files=manifest_paths,
+                message=f"kubectl failed for {target}: {message}",
+                command_sequence=executed_commands,
+            )
 
         return DeploymentResult(
             applied=True,
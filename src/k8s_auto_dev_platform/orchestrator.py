@@ -1,16 +1,25 @@
 """Pipeline orchestration for the Kubernetes auto dev platform."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional
 
 from .deployer import DeploymentResult, KubernetesDeployer
 from .template_manager import TemplateManager
+from .templates import BaseTemplate
 from .test_runner import TestResult, TestRunner
+from .utils import RENDER_CACHE_ENV_VAR, cache_enabled, default_cache_dir
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """Combined outcome of generating, testing, and deploying a project."""
 
@@ -22,17 +31,27 @@ class PipelineResult:
 
 
 class K8sAutoDevPlatform:
-    """Coordinate code generation, automated testing, and deployment."""
+    """Coordinate code generation, automated testing, and deployment.
+
+    When *render_cache_dir* is given (or ``K8S_AUTODEV_RENDER_CACHE=1`` is set,
+    which selects ``$XDG_CACHE_HOME/k8s-auto-dev/renders``), generated projects
+    are stored there keyed by template and validated requirements, and identical
+    later runs copy the stored tree instead of rendering it again.
+    """
 
     def __init__(
         self,
         template_manager: TemplateManager | None = None,
         tester: TestRunner | None = None,
         deployer: KubernetesDeployer | None = None,
+        render_cache_dir: Path | str | None = None,
     ) -> None:
         self.template_manager = template_manager or TemplateManager()
         self.test_runner = tester or TestRunner()
         self.deployer = deployer or KubernetesDeployer()
+        if render_cache_dir is None and cache_enabled(RENDER_CACHE_ENV_VAR):
+            render_cache_dir = default_cache_dir() / "renders"
+        self.render_cache_dir = Path(render_cache_dir) if render_cache_dir is not None else None
 
     def run_pipeline(
         self,
@@ -46,20 +65,17 @@ class K8sAutoDevPlatform:
     ) -> PipelineResult:
         """Execute the end-to-end pipeline for the provided specification."""
 
-        output_path = Path(output_dir).resolve()
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        template = self.template_manager.get_template(template_name)
-        validated_requirements = template.validate_requirements(requirements)
-        project_path = template.generate_project(validated_requirements, output_path)
+        template, validated_requirements, output_path = self._prepare(
+            requirements, template_name, output_dir
+        )
+        project_path = self._generate(template, validated_requirements, output_path)
 
         test_result: TestResult | None = None
         if run_tests:
             test_result = self.test_runner.run(project_path)
 
-        should_deploy = deploy and (test_result is None or test_result.passed)
         deployment_result: DeploymentResult | None = None
-        if should_deploy:
+        if _should_deploy(deploy, test_result):
             deployment_result = self.deployer.deploy(project_path, namespace=namespace)
 
         return PipelineResult(
@@ -69,3 +85,155 @@ class K8sAutoDevPlatform:
             test_result=test_result,
             deployment_result=deployment_result,
         )
+
+    async def run_pipeline_async(
+        self,
+        requirements: Mapping[str, Any],
+        template_name: str,
+        output_dir: Path | str,
+        *,
+        run_tests: bool = True,
+        deploy: bool = True,
+        namespace: str | None = None,
+    ) -> PipelineResult:
+        """Asynchronous variant of :meth:`run_pipeline`.
+
+        Project generation runs in a worker thread and the test and kubectl
+        subprocesses are awaited, so several pipelines can make progress at once.
+        """
+
+        template, validated_requirements, output_path = self._prepare(
+            requirements, template_name, output_dir
+        )
+        project_path = await asyncio.to_thread(self._generate, template, validated_requirements, output_path)
+
+        test_result: TestResult | None = None
+        if run_tests:
+            test_result = await self.test_runner.run_async(project_path)
+
+        deployment_result: DeploymentResult | None = None
+        if _should_deploy(deploy, test_result):
+            deployment_result = await self.deployer.deploy_async(project_path, namespace=namespace)
+
+        return PipelineResult(
+            project_path=project_path,
+            template_name=template.name,
+            requirements=validated_requirements,
+            test_result=test_result,
+            deployment_result=deployment_result,
+        )
+
+    async def run_pipelines(
+        self,
+        requirements_list: Iterable[Mapping[str, Any]],
+        template_name: str,
+        output_dir: Path | str,
+        *,
+        run_tests: bool = True,
+        deploy: bool = True,
+        namespace: str | None = None,
+        max_concurrency: int = 4,
+    ) -> list[PipelineResult | BaseException]:
+        """Run one pipeline per specification, at most *max_concurrency* at a time.
+
+        Results are returned in input order; a pipeline that raised contributes
+        its exception instead of a :class:`PipelineResult`.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(requirements: Mapping[str, Any]) -> PipelineResult:
+            async with semaphore:
+                return await self.run_pipeline_async(
+                    requirements,
+                    template_name=template_name,
+                    output_dir=output_dir,
+                    run_tests=run_tests,
+                    deploy=deploy,
+                    namespace=namespace,
+                )
+
+        return await asyncio.gather(
+            *(run_one(requirements) for requirements in requirements_list),
+            return_exceptions=True,
+        )
+
+    def _prepare(
+        self, requirements: Mapping[str, Any], template_name: str, output_dir: Path | str
+    ) -> tuple[BaseTemplate, Mapping[str, Any], Path]:
+        """Resolve the template, validate *requirements*, and create the output directory."""
+        output_path = Path(output_dir).resolve()
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        template = self.template_manager.get_template(template_name)
+        return template, template.validate_requirements(requirements), output_path
+
+    def _generate(
+        self, template: BaseTemplate, requirements: Mapping[str, Any], output_path: Path
+    ) -> Path:
+        if self.render_cache_dir is None:
+            return template.generate_project(requirements, output_path)
+
+        cached_root = self.render_cache_dir / _render_key(template, requirements)
+        cached = _cached_project(cached_root)
+        if cached is not None:
+            project_path = output_path / cached.name
+            try:
+                shutil.copytree(cached, project_path)
+            except FileExistsError as exc:
+                raise FileExistsError(f"Target project directory already exists: {project_path}") from exc
+            return project_path
+
+        project_path = template.generate_project(requirements, output_path)
+        # Populate the cache through a uniquely named staging directory so that a
+        # concurrent writer never exposes a partially copied tree.
+        staging = self.render_cache_dir / f".{cached_root.name}.{uuid.uuid4().hex}"
+        try:
+            shutil.copytree(project_path, staging / project_path.name)
+            staging.rename(cached_root)
+        except OSError:  # pragma: no cover - cache is best effort
+            shutil.rmtree(staging, ignore_errors=True)
+        return project_path
+
+
+def _should_deploy(deploy: bool, test_result: TestResult | None) -> bool:
+    """Deploy only when requested and no test run failed."""
+    return deploy and (test_result is None or test_result.passed)
+
+
+def _render_key(template: BaseTemplate, requirements: Mapping[str, Any]) -> str:
+    """Hash the template identity and the requirements it renders."""
+    template_cls = type(template)
+    payload = {
+        "template": f"{template_cls.__module__}.{template_cls.__qualname__}",
+        "version": template.version,
+        "source": _template_source_stamp(template_cls),
+        "requirements": requirements,
+    }
+    # Keys are not sorted: responses may mix int and str keys, which cannot be
+    # ordered. Insertion order is kept, as in the JSON the template emits.
+    encoded = json.dumps(payload, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _template_source_stamp(template_cls: type) -> list[int] | None:
+    """Return the mtime and size of the module defining *template_cls*.
+
+    Editing a template without bumping its version still changes the render key.
+    """
+    source = inspect.getsourcefile(template_cls)
+    if source is None:
+        return None
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _cached_project(cached_root: Path) -> Path | None:
+    """Return the project tree stored under *cached_root*, if there is one."""
+    try:
+        return next((entry for entry in cached_root.iterdir() if entry.is_dir()), None)
+    except FileNotFoundError:
+        return None
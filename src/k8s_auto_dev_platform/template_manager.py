@@ -21,19 +21,27 @@ class TemplateManager:
 
     def __init__(self, registry: Dict[str, Type[BaseTemplate]] | None = None) -> None:
         self._registry: Dict[str, Type[BaseTemplate]] = registry or dict(TEMPLATE_REGISTRY)
+        self._info_cache: tuple[TemplateInfo, ...] | None = None
 
     def list_templates(self) -> Iterable[TemplateInfo]:
-        for name, template_cls in self._registry.items():
-            template = template_cls()
-            yield TemplateInfo(
-                name=template.name,
-                description=template.description,
-                version=getattr(template, "version", None),
+        # Template metadata lives on the class, so there is no need to instantiate.
+        if self._info_cache is None:
+            self._info_cache = tuple(
+                TemplateInfo(
+                    name=template_cls.name,
+                    description=template_cls.description,
+                    version=getattr(template_cls, "version", None),
+                )
+                for template_cls in self._registry.values()
             )
+        return self._info_cache
+
+    def has_template(self, name: str) -> bool:
+        """Return whether :meth:`get_template` would resolve *name*."""
+        return name in self._registry
 
     def get_template(self, name: str) -> BaseTemplate:
-        try:
-            template_cls = self._registry[name]
-        except KeyError as exc:  # pragma: no cover - defensive, covered via tests
-            raise KeyError(f"Unknown template '{name}'. Available: {sorted(self._registry)}") from exc
+        template_cls = self._registry.get(name)
+        if template_cls is None:  # pragma: no cover - defensive, covered via tests
+            raise KeyError(f"Unknown template '{name}'. Available: {sorted(self._registry)}")
         return template_cls()
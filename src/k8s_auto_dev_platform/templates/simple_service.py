@@ -2,283 +2,58 @@
 from __future__ import annotations
 
 import json
-import textwrap
 from pathlib import Path
 from typing import Any, Mapping
 
 from .base import BaseTemplate
-from ..utils import slugify, write_json, write_text
+from ..utils import dump_json, slugify, write_bytes, write_text
 
-_ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE"}
+_ALLOWED_METHODS: frozenset[str] = frozenset({"GET", "POST", "PUT", "DELETE"})
+_ALLOWED_METHODS_MSG = ", ".join(sorted(_ALLOWED_METHODS))
+# Reused encoder; json.dumps builds a fresh JSONEncoder for non-default options.
+# NaN and Infinity are rejected: they are not JSON, and repr spells them as the
+# undefined names nan/inf in the generated routes module.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False)
 
+# Generated file bodies. The text *_TEMPLATE constants are filled in with
+# str.format, so literal braces inside them are doubled.
+_APP_INIT_TEMPLATE = '''"""{description}"""
 
-class SimplePythonServiceTemplate(BaseTemplate):
-    """Generate a lightweight HTTP JSON service powered by http.server."""
-
-    name = "simple-python-service"
-    description = "Lightweight Python service using the standard library HTTP server."
-    version = "1.0.0"
-
-    def validate_requirements(self, requirements: Mapping[str, Any]) -> Mapping[str, Any]:
-        requirements = dict(requirements)
-        self._ensure_fields(requirements, ["service_name", "description"])
-
-        service_name = str(requirements["service_name"])
-        slug = slugify(service_name)
-        version = str(requirements.get("version", "0.1.0"))
-        container_image = requirements.get("container_image") or f"registry.example.com/{slug}:{version}"
-
-        routes = list(requirements.get("routes") or [])
-        normalized_routes: list[dict[str, Any]] = []
-        if not routes:
-            normalized_routes.append(
-                {
-                    "name": "root",
-                    "identifier": "root",
-                    "method": "GET",
-                    "path": "/",
-                    "status": 200,
-                    "response": {"message": f"Hello from {service_name}!"},
-                }
-            )
-        else:
-            for index, route in enumerate(routes):
-                if not isinstance(route, Mapping):
-                    raise ValueError("Each route must be described by a mapping/dictionary.")
-                name = str(route.get("name") or f"route_{index + 1}")
-                identifier = slugify(name).replace("-", "_") or f"route_{index + 1}"
-                method = str(route.get("method", "GET")).upper()
-                if method not in _ALLOWED_METHODS:
-                    allowed = ", ".join(sorted(_ALLOWED_METHODS))
-                    raise ValueError(f"Unsupported HTTP method '{method}'. Allowed: {allowed}")
-                path = route.get("path")
-                if not path or not str(path).startswith("/"):
-                    raise ValueError("Each route must define a path starting with '/'.")
-                status = int(route.get("status", 200))
-                response = route.get("response") or {"message": f"Response from {name}"}
-                normalized_routes.append(
-                    {
-                        "name": name,
-                        "identifier": identifier,
-                        "method": method,
-                        "path": str(path),
-                        "status": status,
-                        "response": response,
-                    }
-                )
-
-        normalized = requirements
-        normalized.update(
-            {
-                "service_name": service_name,
-                "description": str(requirements["description"]),
-                "version": version,
-                "container_image": str(container_image),
-                "slug": slug,
-                "routes": normalized_routes,
-                "port": int(requirements.get("port", 8000)),
-            }
-        )
-        return normalized
-
-    def generate_project(self, requirements: Mapping[str, Any], destination: Path) -> Path:
-        if "slug" not in requirements:
-            requirements = self.validate_requirements(requirements)
-
-        slug = requirements["slug"]
-        project_dir = (destination / f"{slug}-service").resolve()
-        if project_dir.exists():
-            raise FileExistsError(f"Target project directory already exists: {project_dir}")
-
-        app_dir = project_dir / "app"
-        tests_dir = project_dir / "tests"
-        k8s_dir = project_dir / "k8s"
-
-        app_dir.mkdir(parents=True, exist_ok=True)
-        tests_dir.mkdir(parents=True, exist_ok=True)
-        k8s_dir.mkdir(parents=True, exist_ok=True)
-
-        self._write_app_package(app_dir, requirements)
-        self._write_tests(tests_dir, requirements)
-        self._write_project_readme(project_dir, requirements)
-        self._write_dockerfile(project_dir)
-        self._write_k8s_manifests(k8s_dir, requirements)
-        write_json(project_dir / "project-metadata.json", self._export_metadata(requirements))
-
-        return project_dir
-
-    def _write_app_package(self, app_dir: Path, spec: Mapping[str, Any]) -> None:
-        write_text(
-            app_dir / "__init__.py",
-            textwrap.dedent(
-                f'''"""{spec['description']}"""
-
-SERVICE_NAME = "{spec['service_name']}"
-VERSION = "{spec['version']}"
+SERVICE_NAME = "{service_name}"
+VERSION = "{version}"
 '''
-            ),
-        )
-
-        write_text(app_dir / "routes.py", self._render_routes_module(spec))
-        write_text(app_dir / "server.py", self._render_server_module(spec))
-
-    def _write_tests(self, tests_dir: Path, spec: Mapping[str, Any]) -> None:
-        write_text(tests_dir / "__init__.py", "")
-        write_text(tests_dir / "test_routes.py", self._render_tests(spec))
-
-    def _write_project_readme(self, project_dir: Path, spec: Mapping[str, Any]) -> None:
-        routes_section = "\n".join(
-            f"- **{route['method']} {route['path']}** → returns {json.dumps(route['response'], ensure_ascii=False)}"
-            for route in spec["routes"]
-        )
-        write_text(
-            project_dir / "README.md",
-            textwrap.dedent(
-                f'''# {spec['service_name']} Service
-
-{spec['description']}
 
-## Endpoints
-
-{routes_section or 'No routes defined.'}
-
-## Local Development
-
-```bash
-python -m app.server
-```
-
-## Testing
-
-```bash
-python -m unittest discover
-```
-
-## Deployment
-
-Docker image: `{spec['container_image']}`
-
-Apply the manifests in `k8s/` to deploy the service onto a Kubernetes cluster.
-'''
-            ),
-        )
-
-    def _write_dockerfile(self, project_dir: Path) -> None:
-        write_text(
-            project_dir / "Dockerfile",
-            textwrap.dedent(
-                """FROM python:3.11-slim
-WORKDIR /app
-COPY app ./app
-CMD ["python", "-m", "app.server"]
-"""
-            ),
-        )
-
-    def _write_k8s_manifests(self, k8s_dir: Path, spec: Mapping[str, Any]) -> None:
-        deployment = textwrap.dedent(
-            f'''apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: {spec['slug']}
-  labels:
-    app: {spec['slug']}
-spec:
-  replicas: 1
-  selector:
-    matchLabels:
-      app: {spec['slug']}
-  template:
-    metadata:
-      labels:
-        app: {spec['slug']}
-    spec:
-      containers:
-        - name: {spec['slug']}
-          image: {spec['container_image']}
-          command: ["python", "-m", "app.server"]
-          ports:
-            - containerPort: {spec['port']}
-'''
-        )
-        service = textwrap.dedent(
-            f'''apiVersion: v1
-kind: Service
-metadata:
-  name: {spec['slug']}
-  labels:
-    app: {spec['slug']}
-spec:
-  selector:
-    app: {spec['slug']}
-  ports:
-    - protocol: TCP
-      port: 80
-      targetPort: {spec['port']}
-  type: ClusterIP
-'''
-        )
-        write_text(k8s_dir / "deployment.yaml", deployment)
-        write_text(k8s_dir / "service.yaml", service)
-
-    def _render_routes_module(self, spec: Mapping[str, Any]) -> str:
-        route_blocks = []
-        for route in spec["routes"]:
-            payload = {
-                "name": route["name"],
-                "identifier": route["identifier"],
-                "method": route["method"],
-                "path": route["path"],
-                "status": route["status"],
-                "response": route["response"],
-            }
-            route_blocks.append(textwrap.indent(json.dumps(payload, indent=4, ensure_ascii=False), "    "))
-
-        routes_literal = ",\n".join(route_blocks)
-        if routes_literal:
-            routes_literal = f"{routes_literal}\n"
-        return textwrap.dedent(
-            f'''"""Route definitions for {spec['service_name']}"""
+_ROUTES_MODULE_TEMPLATE = '''"""Route definitions for {service_name}"""
 from __future__ import annotations
 
 from typing import Dict, Tuple
 
-ROUTES = [
-{routes_literal}]
+ROUTES = {routes_literal}
 
-
-def get_route_map() -> Dict[Tuple[str, str], dict]:
-    return {{(route['method'], route['path']): route for route in ROUTES}}
+# Status code and pre-serialized JSON body for every (method, path).
+RESPONSES: Dict[Tuple[str, str], Tuple[int, bytes]] = {{
+{response_entries}}}
 '''
-        )
 
-    def _render_server_module(self, spec: Mapping[str, Any]) -> str:
-        return textwrap.dedent(
-            f'''"""HTTP server for {spec['service_name']}"""
+_SERVER_MODULE_TEMPLATE = '''"""HTTP server for {service_name}"""
 from __future__ import annotations
 
-import json
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Dict, Tuple
-from urllib.parse import urlparse
 
-from .routes import get_route_map
+from .routes import RESPONSES
 
-ROUTE_MAP = get_route_map()
+NOT_FOUND = (404, b'{{"error": "Not Found"}}')
 
 
 class DynamicRequestHandler(BaseHTTPRequestHandler):
     """Serve JSON responses for generated routes."""
 
     def _handle(self, method: str) -> None:
-        parsed = urlparse(self.path)
-        route = ROUTE_MAP.get((method, parsed.path))
-        if not route:
-            self.send_error(404, "Not Found")
-            return
-
-        body = json.dumps(route.get("response", {{}}), ensure_ascii=False).encode("utf-8")
-        status = int(route.get("status", 200))
+        path = self.path
+        query = path.find("?")
+        if query != -1:
+            path = path[:query]
+        status, body = RESPONSES.get((method, path), NOT_FOUND)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -301,7 +76,7 @@ class DynamicRequestHandler(BaseHTTPRequestHandler):
         return
 
 
-def create_server(host: str = "0.0.0.0", port: int = {spec['port']}) -> HTTPServer:
+def create_server(host: str = "0.0.0.0", port: int = {port}) -> HTTPServer:
     return HTTPServer((host, port), DynamicRequestHandler)
 
 
@@ -312,7 +87,7 @@ def serve_forever(server: HTTPServer) -> None:
         server.server_close()
 
 
-def run(host: str = "0.0.0.0", port: int = {spec['port']}) -> None:
+def run(host: str = "0.0.0.0", port: int = {port}) -> None:
     server = create_server(host=host, port=port)
     try:
         serve_forever(server)
@@ -323,15 +98,13 @@ def run(host: str = "0.0.0.0", port: int = {spec['port']}) -> None:
 if __name__ == "__main__":
     run()
 '''
-        )
 
-    def _render_tests(self, spec: Mapping[str, Any]) -> str:
-        return textwrap.dedent(
-            '''"""Automated tests for generated routes."""
+_TESTS_MODULE = '''"""Automated tests for generated routes."""
 from __future__ import annotations
 
 import http.client
 import json
+import socket
 import threading
 import time
 import unittest
@@ -352,7 +125,18 @@ class RouteTestCase(unittest.TestCase):
         cls.port = cls.server.server_address[1]
         cls.server_thread = threading.Thread(target=serve_forever, args=(cls.server,), daemon=True)
         cls.server_thread.start()
-        time.sleep(0.2)
+        cls._wait_for_server()
+
+    @classmethod
+    def _wait_for_server(cls, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with socket.socket() as probe:
+                try:
+                    probe.connect(("127.0.0.1", cls.port))
+                    return
+                except OSError:
+                    time.sleep(0.005)
 
     @classmethod
     def tearDownClass(cls) -> None:
@@ -384,8 +168,276 @@ class RouteTestCase(unittest.TestCase):
 if __name__ == "__main__":
     unittest.main()
 '''
+
+_README_TEMPLATE = '''# {service_name} Service
+
+{description}
+
+## Endpoints
+
+{routes_section}
+
+## Local Development
+
+```bash
+python -m app.server
+```
+
+## Testing
+
+```bash
+python -m unittest discover
+```
+
+## Deployment
+
+Docker image: `{container_image}`
+
+Apply the manifests in `k8s/` to deploy the service onto a Kubernetes cluster.
+'''
+
+# Static files and Kubernetes manifests are kept as UTF-8 bytes and written
+# as-is; manifests fill their __PLACEHOLDER__ markers with bytes.replace.
+_DOCKERFILE = b"""FROM python:3.11-slim
+WORKDIR /app
+COPY app ./app
+CMD ["python", "-m", "app.server"]
+"""
+
+_DEPLOYMENT_TEMPLATE = b'''apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: __SLUG__
+  labels:
+    app: __SLUG__
+spec:
+  replicas: 1
+  selector:
+    matchLabels:
+      app: __SLUG__
+  template:
+    metadata:
+      labels:
+        app: __SLUG__
+    spec:
+      containers:
+        - name: __SLUG__
+          image: __IMAGE__
+          command: ["python", "-m", "app.server"]
+          ports:
+            - containerPort: __PORT__
+'''
+
+_SERVICE_TEMPLATE = b'''apiVersion: v1
+kind: Service
+metadata:
+  name: __SLUG__
+  labels:
+    app: __SLUG__
+spec:
+  selector:
+    app: __SLUG__
+  ports:
+    - protocol: TCP
+      port: 80
+      targetPort: __PORT__
+  type: ClusterIP
+'''
+
+
+class _ValidatedRequirements(dict):
+    """Requirements already normalized by validate_requirements."""
+
+    __slots__ = ()
+
+
+def _write_file(path: Path, content: str | bytes) -> None:
+    if isinstance(content, bytes):
+        write_bytes(path, content)
+    else:
+        write_text(path, content)
+
+
+class SimplePythonServiceTemplate(BaseTemplate):
+    """Generate a lightweight HTTP JSON service powered by http.server."""
+
+    name = "simple-python-service"
+    description = "Lightweight Python service using the standard library HTTP server."
+    version = "1.0.0"
+
+    def validate_requirements(self, requirements: Mapping[str, Any]) -> Mapping[str, Any]:
+        self._ensure_fields(requirements, ["service_name", "description"])
+
+        service_name = str(requirements["service_name"])
+        slug = slugify(service_name)
+        version = str(requirements.get("version", "0.1.0"))
+        container_image = requirements.get("container_image") or f"registry.example.com/{slug}:{version}"
+
+        routes = list(requirements.get("routes") or [])
+        normalized_routes: list[dict[str, Any]] = []
+        if not routes:
+            normalized_routes.append(
+                {
+                    "name": "root",
+                    "identifier": "root",
+                    "method": "GET",
+                    "path": "/",
+                    "status": 200,
+                    "response": {"message": f"Hello from {service_name}!"},
+                }
+            )
+        else:
+            # Bind globals and builtins locally; this loop runs once per route.
+            _str, _int, _slug, _allowed, _Mapping = str, int, slugify, _ALLOWED_METHODS, Mapping
+            _encode = _COMPACT_ENCODER.encode
+            append = normalized_routes.append
+            for index, route in enumerate(routes):
+                if not isinstance(route, _Mapping):
+                    raise ValueError("Each route must be described by a mapping/dictionary.")
+                name = _str(route.get("name") or f"route_{index + 1}")
+                method = _str(route.get("method", "GET")).upper()
+                if method not in _allowed:
+                    raise ValueError(f"Unsupported HTTP method '{method}'. Allowed: {_ALLOWED_METHODS_MSG}")
+                path = route.get("path")
+                if not path or not _str(path).startswith("/"):
+                    raise ValueError("Each route must define a path starting with '/'.")
+                response = route.get("response") or {"message": f"Response from {name}"}
+                try:
+                    _encode(response)
+                except ValueError as exc:
+                    raise ValueError(f"Route '{name}' response must not contain NaN or Infinity.") from exc
+                append(
+                    {
+                        "name": name,
+                        "identifier": _slug(name).replace("-", "_") or f"route_{index + 1}",
+                        "method": method,
+                        "path": _str(path),
+                        "status": _int(route.get("status", 200)),
+                        "response": response,
+                    }
+                )
+
+        normalized = _ValidatedRequirements(requirements)
+        normalized.update(
+            {
+                "service_name": service_name,
+                "description": str(requirements["description"]),
+                "version": version,
+                "container_image": str(container_image),
+                "slug": slug,
+                "routes": normalized_routes,
+                "port": int(requirements.get("port", 8000)),
+            }
+        )
+        return normalized
+
+    def generate_project(self, requirements: Mapping[str, Any], destination: Path) -> Path:
+        if not isinstance(requirements, _ValidatedRequirements):
+            requirements = self.validate_requirements(requirements)
+
+        slug = requirements["slug"]
+        project_dir = (destination / f"{slug}-service").resolve()
+        try:
+            project_dir.mkdir(parents=True)
+        except FileExistsError as exc:
+            raise FileExistsError(f"Target project directory already exists: {project_dir}") from exc
+
+        # The project directory is brand new, so its children need no existence checks.
+        app_dir = project_dir / "app"
+        tests_dir = project_dir / "tests"
+        k8s_dir = project_dir / "k8s"
+
+        app_dir.mkdir()
+        tests_dir.mkdir()
+        k8s_dir.mkdir()
+
+        files: list[tuple[Path, str | bytes]] = [
+            (app_dir / "__init__.py", self._render_app_init(requirements)),
+            (app_dir / "routes.py", self._render_routes_module(requirements)),
+            (app_dir / "server.py", self._render_server_module(requirements)),
+            (tests_dir / "__init__.py", ""),
+            (tests_dir / "test_routes.py", self._render_tests(requirements)),
+            (project_dir / "README.md", self._render_project_readme(requirements)),
+            (project_dir / "Dockerfile", _DOCKERFILE),
+            (k8s_dir / "deployment.yaml", self._render_deployment_manifest(requirements)),
+            (k8s_dir / "service.yaml", self._render_service_manifest(requirements)),
+            (project_dir / "project-metadata.json", dump_json(self._export_metadata(requirements))),
+        ]
+        for path, content in files:
+            _write_file(path, content)
+
+        return project_dir
+
+    def _render_app_init(self, spec: Mapping[str, Any]) -> str:
+        return _APP_INIT_TEMPLATE.format(
+            description=spec["description"],
+            service_name=spec["service_name"],
+            version=spec["version"],
+        )
+
+    def _render_project_readme(self, spec: Mapping[str, Any]) -> str:
+        encode = _COMPACT_ENCODER.encode
+        routes_section = "\n".join(
+            f"- **{route['method']} {route['path']}** → returns {encode(route['response'])}"
+            for route in spec["routes"]
+        )
+        return _README_TEMPLATE.format(
+            service_name=spec["service_name"],
+            description=spec["description"],
+            routes_section=routes_section or "No routes defined.",
+            container_image=spec["container_image"],
+        )
+
+    def _render_deployment_manifest(self, spec: Mapping[str, Any]) -> bytes:
+        return (
+            _DEPLOYMENT_TEMPLATE.replace(b"__SLUG__", spec["slug"].encode("utf-8"))
+            .replace(b"__IMAGE__", spec["container_image"].encode("utf-8"))
+            .replace(b"__PORT__", str(spec["port"]).encode("ascii"))
         )
 
+    def _render_service_manifest(self, spec: Mapping[str, Any]) -> bytes:
+        return _SERVICE_TEMPLATE.replace(b"__SLUG__", spec["slug"].encode("utf-8")).replace(
+            b"__PORT__", str(spec["port"]).encode("ascii")
+        )
+
+    def _render_routes_module(self, spec: Mapping[str, Any]) -> str:
+        payloads = [
+            {
+                "name": route["name"],
+                "identifier": route["identifier"],
+                "method": route["method"],
+                "path": route["path"],
+                "status": route["status"],
+                "response": route["response"],
+            }
+            for route in spec["routes"]
+        ]
+        # The (method, path) lookup table is spelled out at generation time so the
+        # generated service does not rebuild it on every start, and response bodies
+        # are serialized here so the server does no JSON work per request. Python
+        # literals are emitted with repr, since JSON spells True/None as true/null.
+        encode = _COMPACT_ENCODER.encode
+        response_entries = "".join(
+            f"    {(payload['method'], payload['path'])!r}: "
+            f"({payload['status']}, {encode(payload['response']).encode('utf-8')!r}),\n"
+            for payload in payloads
+        )
+        # ROUTES goes through JSON first so it holds exactly what the server sends
+        # (lists for tuples, string keys, plain dicts); each route is then spelled
+        # as Python with repr, one per line.
+        routes_data = json.loads(encode(payloads))
+        return _ROUTES_MODULE_TEMPLATE.format(
+            service_name=spec["service_name"],
+            routes_literal="[\n" + "".join(f"    {route!r},\n" for route in routes_data) + "]",
+            response_entries=response_entries,
+        )
+
+    def _render_server_module(self, spec: Mapping[str, Any]) -> str:
+        return _SERVER_MODULE_TEMPLATE.format(service_name=spec["service_name"], port=spec["port"])
+
+    def _render_tests(self, spec: Mapping[str, Any]) -> str:
+        return _TESTS_MODULE
+
     def _export_metadata(self, spec: Mapping[str, Any]) -> Mapping[str, Any]:
         return {
             "template": self.name,
@@ -1,42 +1,122 @@
 """Test execution helpers for generated projects."""
 from __future__ import annotations
 
+import asyncio
+import importlib
+import io
 import subprocess
 import sys
+import threading
+import unittest
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
 
+# In-process runs swap entries in sys.modules and sys.path, so only one may run at a time.
+_IN_PROCESS_LOCK = threading.Lock()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TestResult:
     """Result of executing a project's automated tests."""
 
     passed: bool
     command: Sequence[str]
-    output: str
+    raw_output: bytes
     return_code: int
 
+    @property
+    def output(self) -> str:
+        """Combined stdout and stderr, decoded on demand."""
+        return self.raw_output.decode("utf-8", errors="replace")
+
 
 class TestRunner:
-    """Run the default unit test command for generated projects."""
+    """Run the default unit test command for generated projects.
 
-    def __init__(self, python_executable: str | None = None) -> None:
+    With ``in_process=True`` the generated tests are discovered and run by
+    :mod:`unittest` inside the current interpreter instead of a child process.
+    """
+
+    def __init__(self, python_executable: str | None = None, *, in_process: bool = False) -> None:
         self._python = python_executable or sys.executable
+        self._in_process = in_process
+
+    def _command(self) -> list[str]:
+        return [self._python, "-m", "unittest", "discover"]
 
     def run(self, project_path: Path) -> TestResult:
-        command = [self._python, "-m", "unittest", "discover"]
+        if self._in_process:
+            return self._run_in_process(project_path)
+        command = self._command()
         completed = subprocess.run(
             command,
             cwd=project_path,
             capture_output=True,
-            text=True,
             check=False,
         )
-        output = (completed.stdout or "") + (completed.stderr or "")
         return TestResult(
             passed=completed.returncode == 0,
             command=command,
-            output=output,
+            raw_output=completed.stdout + completed.stderr,
             return_code=completed.returncode,
         )
+
+    async def run_async(self, project_path: Path) -> TestResult:
+        """Asynchronous variant of :meth:`run` that awaits the test subprocess."""
+        if self._in_process:
+            return await asyncio.to_thread(self._run_in_process, project_path)
+        command = self._command()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=str(project_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        return_code = process.returncode
+        assert return_code is not None  # set once communicate() has returned
+        return TestResult(
+            passed=return_code == 0,
+            command=command,
+            raw_output=stdout + stderr,
+            return_code=return_code,
+        )
+
+    def _run_in_process(self, project_path: Path) -> TestResult:
+        start_dir = str(project_path)
+        command = ["unittest", "discover", "-s", start_dir, "-t", start_dir]
+        # Generated projects use generic top-level names such as ``app`` and ``tests``;
+        # set aside any modules already imported under those names and drop the
+        # project's modules afterwards so consecutive runs do not see each other.
+        top_level = {entry.name for entry in project_path.iterdir() if entry.is_dir()}
+        top_level.update(entry.stem for entry in project_path.glob("*.py"))
+
+        def owned(module_name: str) -> bool:
+            return module_name.partition(".")[0] in top_level
+
+        stream = io.StringIO()
+        with _IN_PROCESS_LOCK:
+            saved_modules = {name: module for name, module in sys.modules.items() if owned(name)}
+            for name in saved_modules:
+                del sys.modules[name]
+            saved_path = sys.path[:]
+            try:
+                importlib.invalidate_caches()
+                # A private loader: discover() leaves _top_level_dir set on the loader,
+                # which would leak this project's path into the shared default one.
+                suite = unittest.TestLoader().discover(start_dir, top_level_dir=start_dir)
+                outcome = unittest.TextTestRunner(stream=stream).run(suite)
+            finally:
+                sys.path[:] = saved_path
+                for name in [name for name in sys.modules if owned(name)]:
+                    del sys.modules[name]
+                sys.modules.update(saved_modules)
+
+        passed = outcome.wasSuccessful()
+        return TestResult(
+            passed=passed,
+            command=command,
+            raw_output=stream.getvalue().encode("utf-8"),
+            return_code=0 if passed else 1,
+        )
@@ -2,19 +2,25 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+CACHE_ENV_VAR = "K8S_AUTODEV_CACHE"
+RENDER_CACHE_ENV_VAR = "K8S_AUTODEV_RENDER_CACHE"
+
 _SLUGIFY_PATTERN = re.compile(r"[^a-z0-9]+")
+_WRITE_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
 
 
+@lru_cache(maxsize=256)
 def slugify(value: str) -> str:
     """Create a filesystem-friendly slug from the provided value."""
-    normalized = value.strip().lower()
-    normalized = _SLUGIFY_PATTERN.sub("-", normalized)
-    normalized = normalized.strip("-")
+    # Surrounding whitespace is folded into hyphens by the pattern and stripped below.
+    normalized = _SLUGIFY_PATTERN.sub("-", value.lower()).strip("-")
     return normalized or "project"
 
 
@@ -24,6 +30,28 @@ def write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def write_bytes(path: Path, content: bytes) -> None:
+    """Write raw *content* to *path*, creating parent directories when needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def dump_json(payload: Any) -> str:
+    """Serialize *payload* as formatted JSON text with a trailing newline."""
+    return _WRITE_JSON_ENCODER.encode(payload) + "\n"
+
+
 def write_json(path: Path, payload: Any) -> None:
     """Write *payload* as formatted JSON to *path*."""
-    write_text(path, json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
+    write_text(path, dump_json(payload))
+
+
+def cache_enabled(env_var: str = CACHE_ENV_VAR) -> bool:
+    """Return whether the opt-in cache switched by *env_var* is on (set to ``1``)."""
+    return os.environ.get(env_var) == "1"
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory, honouring ``XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "k8s-auto-dev"
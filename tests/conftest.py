@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_TMPFS_ROOT = pytest.StashKey[Path | None]()
+
+
+def _tmpfs_root() -> Path | None:
+    configured = os.environ.get("TEST_TMPFS")
+    if configured:
+        path = Path(configured)
+        if not path.is_dir():
+            raise pytest.UsageError(f"TEST_TMPFS must name an existing directory: {configured}")
+        return path
+    if sys.platform == "linux":
+        candidate = Path("/dev/shm")
+        if candidate.is_dir() and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Resolved once so that a bad TEST_TMPFS is reported before any test runs.
+    config.stash[_TMPFS_ROOT] = _tmpfs_root()
+
+
+@pytest.fixture(scope="session")
+def tmpfs_root(pytestconfig: pytest.Config) -> Path | None:
+    """Memory-backed parent for temporary project trees, or None for the system default.
+
+    The pipeline writes many small files and immediately reads them back, so tests
+    that generate projects create their temporary directories here.
+    """
+    return pytestconfig.stash[_TMPFS_ROOT]
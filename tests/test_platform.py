@@ -1,30 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import runpy
 import sys
 import tempfile
-import unittest
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterator
 
-from k8s_auto_dev_platform.deployer import KubernetesDeployer
-from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform
-from k8s_auto_dev_platform.template_manager import TemplateManager
-from k8s_auto_dev_platform.test_runner import TestRunner
+import pytest
 
+# Platform modules are imported inside the fixtures and tests that use them, so
+# collection and deselected runs do not pay for the pipeline's import graph.
+if TYPE_CHECKING:
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform, PipelineResult
+    from k8s_auto_dev_platform.template_manager import TemplateManager
 
-class TemplateManagerTestCase(unittest.TestCase):
-    def test_simple_template_is_registered(self) -> None:
-        manager = TemplateManager()
-        template_names = [info.name for info in manager.list_templates()]
-        self.assertIn("simple-python-service", template_names)
 
-
-class PipelineTestCase(unittest.TestCase):
-    def test_full_pipeline_generates_and_tests_project(self) -> None:
-        requirements = {
-            "service_name": "Inventory",
-            "description": "Inventory management microservice.",
-            "version": "0.2.0",
-            "routes": [
+# Read-only so that a pipeline which mutated its input would fail loudly. Response
+# payloads stay plain dicts: the template JSON-encodes them (for the served bodies
+# and the ROUTES literal), and json rejects a mappingproxy as not serializable.
+_REQUIREMENTS = MappingProxyType(
+    {
+        "service_name": "Inventory",
+        "description": "Inventory management microservice.",
+        "version": "0.2.0",
+        "routes": (
+            MappingProxyType(
                 {
                     "name": "list_items",
                     "method": "GET",
@@ -36,51 +43,358 @@ class PipelineTestCase(unittest.TestCase):
                             {"sku": "SKU-002", "quantity": 7},
                         ]
                     },
-                },
+                }
+            ),
+            MappingProxyType(
                 {
                     "name": "health",
                     "method": "GET",
                     "path": "/healthz",
                     "status": 200,
                     "response": {"status": "ok"},
-                },
-            ],
-        }
-
-        manager = TemplateManager()
-        tester = TestRunner(python_executable=sys.executable)
-        deployer = KubernetesDeployer(kubectl_path=None)
-        platform = K8sAutoDevPlatform(template_manager=manager, tester=tester, deployer=deployer)
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir)
-            result = platform.run_pipeline(
-                requirements,
-                template_name="simple-python-service",
-                output_dir=output_dir,
-                run_tests=True,
-                deploy=True,
-            )
-
-            self.assertTrue(result.project_path.exists())
-            self.assertTrue((result.project_path / "app" / "server.py").exists())
-
-            self.assertIsNotNone(result.test_result)
-            assert result.test_result is not None
-            self.assertTrue(result.test_result.passed, msg=result.test_result.output)
-
-            self.assertIsNotNone(result.deployment_result)
-            assert result.deployment_result is not None
-            self.assertFalse(result.deployment_result.applied)
-            self.assertTrue(
-                (result.project_path / "k8s" / "deployment-plan.txt").exists(),
-                "Expected deployment plan when kubectl is unavailable",
-            )
-
-            metadata = result.requirements
-            self.assertEqual(metadata["slug"], "inventory")
-            self.assertEqual(len(metadata["routes"]), 2)
-
-
-if __name__ == "__main__":
-    unittest.main()
+                }
+            ),
+        ),
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _shared_manager() -> TemplateManager:
+    from k8s_auto_dev_platform.template_manager import TemplateManager
+
+    return TemplateManager()
+
+
+def test_simple_template_is_registered() -> None:
+    manager = _shared_manager()
+    assert manager.has_template("simple-python-service")
+    assert not manager.has_template("missing-template")
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmpfs_root: Path | None) -> Iterator[Path]:
+    """One temporary tree per module; tests carve out their own subdirectories."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root) as tmp_dir:
+        yield Path(tmp_dir)
+
+
+def _case_dir(tmp_root: Path) -> Path:
+    return tmp_root / uuid.uuid4().hex
+
+
+@pytest.fixture(scope="module")
+def platform() -> K8sAutoDevPlatform:
+    from k8s_auto_dev_platform.deployer import KubernetesDeployer
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform
+    from k8s_auto_dev_platform.test_runner import TestRunner
+
+    manager = _shared_manager()
+    tester = TestRunner(in_process=True)
+    deployer = KubernetesDeployer(kubectl_path=None, plan_sink="memory")
+    return K8sAutoDevPlatform(template_manager=manager, tester=tester, deployer=deployer)
+
+
+@pytest.fixture(scope="module")
+def pipeline_result(platform: K8sAutoDevPlatform, tmp_root: Path) -> PipelineResult:
+    return platform.run_pipeline(
+        _REQUIREMENTS,
+        template_name="simple-python-service",
+        output_dir=_case_dir(tmp_root),
+        run_tests=True,
+        deploy=True,
+    )
+
+
+@pytest.mark.integration
+def test_pipeline_outcome(pipeline_result: PipelineResult) -> None:
+    project_path = pipeline_result.project_path
+    server_py = project_path.joinpath("app", "server.py")
+    test_result = pipeline_result.test_result
+    deployment_result = pipeline_result.deployment_result
+    actual = {
+        "project_exists": project_path.exists(),
+        "server_exists": server_py.exists(),
+        "tests_passed": test_result.passed if test_result else None,
+        "deploy_applied": deployment_result.applied if deployment_result else None,
+        "plan_produced": bool(deployment_result and deployment_result.plan_text),
+        "slug": pipeline_result.requirements["slug"],
+        "route_count": len(pipeline_result.requirements["routes"]),
+    }
+    expected = {
+        "project_exists": True,
+        "server_exists": True,
+        "tests_passed": True,
+        "deploy_applied": False,
+        "plan_produced": True,
+        "slug": "inventory",
+        "route_count": 2,
+    }
+    assert actual == expected, test_result.output if test_result else None
+
+
+def test_generated_routes_module_accepts_json_literals(tmp_root: Path) -> None:
+    manager = _shared_manager()
+    template = manager.get_template("simple-python-service")
+    requirements = {
+        "service_name": "Flags",
+        "description": "Feature flag service.",
+        "routes": [
+            {"path": "/flags", "response": {"enabled": True, "owner": None}},
+            {"path": "/ordered", "response": OrderedDict([("b", 1), ("a", (1, 2))])},
+            {"path": "/limits", "response": {"max": 10, 1: "one"}},
+        ],
+    }
+
+    project_path = template.generate_project(requirements, _case_dir(tmp_root))
+    routes = runpy.run_path(str(project_path.joinpath("app", "routes.py")))
+
+    # ROUTES must equal the decoded bodies the generated tests compare against.
+    assert [route["response"] for route in routes["ROUTES"]] == [
+        {"enabled": True, "owner": None},
+        {"b": 1, "a": [1, 2]},
+        {"max": 10, "1": "one"},
+    ]
+    assert routes["RESPONSES"][("GET", "/flags")] == (200, b'{"enabled": true, "owner": null}')
+
+    # inf and nan have no JSON spelling and repr writes them as undefined names.
+    requirements["routes"] = [{"path": "/limits", "response": {"max": float("inf")}}]
+    with pytest.raises(ValueError, match="must not contain NaN or Infinity"):
+        template.generate_project(requirements, _case_dir(tmp_root))
+
+
+def test_render_cache_reuses_generated_project(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform
+
+    tmp_path = _case_dir(tmp_root)
+    cache_dir = tmp_path / "cache"
+    platform = K8sAutoDevPlatform(template_manager=_shared_manager(), render_cache_dir=cache_dir)
+    requirements = {"service_name": "Catalog", "description": "Catalog service."}
+
+    first = platform.run_pipeline(
+        requirements, "simple-python-service", tmp_path / "first", run_tests=False, deploy=False
+    )
+
+    (cache_entry,) = cache_dir.iterdir()
+    # A hit copies the stored tree, so a change made to it shows up in the next project.
+    with cache_entry.joinpath("catalog-service", "app", "server.py").open("a", encoding="utf-8") as handle:
+        handle.write("# cached\n")
+    second = platform.run_pipeline(
+        requirements, "simple-python-service", tmp_path / "second", run_tests=False, deploy=False
+    )
+
+    assert second.project_path.joinpath("app", "server.py").read_text(encoding="utf-8").endswith("# cached\n")
+    assert not first.project_path.joinpath("app", "server.py").read_text(encoding="utf-8").endswith("# cached\n")
+    with pytest.raises(FileExistsError, match="Target project directory already exists"):
+        platform.run_pipeline(
+            requirements, "simple-python-service", tmp_path / "second", run_tests=False, deploy=False
+        )
+
+
+def test_render_cache_accepts_mixed_response_keys(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform
+
+    tmp_path = _case_dir(tmp_root)
+    platform = K8sAutoDevPlatform(template_manager=_shared_manager(), render_cache_dir=tmp_path / "cache")
+    requirements = {
+        "service_name": "Lookup",
+        "description": "Lookup service.",
+        "routes": [{"path": "/lookup", "response": {"a": 1, 1: "one"}}],
+    }
+
+    for name in ("first", "second"):
+        result = platform.run_pipeline(
+            requirements, "simple-python-service", tmp_path / name, run_tests=False, deploy=False
+        )
+        assert result.project_path.joinpath("app", "routes.py").exists()
+    assert len(list(tmp_path.joinpath("cache").iterdir())) == 1
+
+
+def test_run_pipelines_generates_each_project(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.deployer import DeploymentResult, KubernetesDeployer
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform, PipelineResult
+
+    specs = [
+        {"service_name": "Orders", "description": "Order service."},
+        {"service_name": "Billing", "description": "Billing service."},
+        {"service_name": "Orders", "description": "Duplicate of the first service."},
+    ]
+    platform = K8sAutoDevPlatform(
+        template_manager=_shared_manager(),
+        deployer=KubernetesDeployer(kubectl_path=None),
+    )
+
+    results = asyncio.run(
+        platform.run_pipelines(
+            specs,
+            template_name="simple-python-service",
+            output_dir=_case_dir(tmp_root),
+            run_tests=False,
+            max_concurrency=1,
+        )
+    )
+
+    orders, billing, duplicate = results
+    assert isinstance(orders, PipelineResult)
+    assert isinstance(billing, PipelineResult)
+    assert isinstance(duplicate, FileExistsError)
+    assert orders.project_path.name == "orders-service"
+    assert billing.project_path.name == "billing-service"
+    assert orders.test_result is None
+    assert isinstance(billing.deployment_result, DeploymentResult)
+    assert not billing.deployment_result.applied
+    plan_txt = billing.project_path.joinpath("k8s", "deployment-plan.txt")
+    assert plan_txt.exists()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(sys.platform == "win32", reason="the stand-in kubectl is a POSIX shell script")
+def test_run_pipelines_tests_and_deploys_concurrently(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.deployer import KubernetesDeployer
+    from k8s_auto_dev_platform.orchestrator import K8sAutoDevPlatform, PipelineResult
+    from k8s_auto_dev_platform.test_runner import TestRunner
+
+    tmp_path = _case_dir(tmp_root)
+    tmp_path.mkdir()
+    kubectl = tmp_path / "kubectl"
+    kubectl.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+    kubectl.chmod(0o755)
+    specs = [{"service_name": name, "description": f"{name} service."} for name in ("Alpha", "Beta", "Gamma")]
+    # Subprocess test runs and a real kubectl invocation exercise both awaited paths.
+    platform = K8sAutoDevPlatform(
+        template_manager=_shared_manager(),
+        tester=TestRunner(),
+        deployer=KubernetesDeployer(kubectl_path=str(kubectl)),
+    )
+
+    results = asyncio.run(
+        platform.run_pipelines(
+            specs,
+            template_name="simple-python-service",
+            output_dir=tmp_path / "projects",
+            run_tests=True,
+            deploy=True,
+            max_concurrency=2,
+        )
+    )
+
+    pipelines = [result for result in results if isinstance(result, PipelineResult)]
+    assert pipelines == results
+    actual = [
+        (
+            pipeline.project_path.name,
+            pipeline.test_result.passed if pipeline.test_result else None,
+            pipeline.deployment_result.applied if pipeline.deployment_result else None,
+        )
+        for pipeline in pipelines
+    ]
+    expected = [
+        ("alpha-service", True, True),
+        ("beta-service", True, True),
+        ("gamma-service", True, True),
+    ]
+    assert actual == expected
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the stand-in kubectl is a POSIX shell script")
+def test_deploy_reports_failing_manifests_from_batched_apply(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.deployer import KubernetesDeployer
+
+    tmp_path = _case_dir(tmp_root)
+    manifest_dir = tmp_path / "project" / "k8s"
+    manifest_dir.mkdir(parents=True)
+    manifest_a = manifest_dir / "a.yaml"
+    manifest_b = manifest_dir / "b.yaml"
+    manifest_a.write_text("kind: Service\n", encoding="utf-8")
+    manifest_b.write_text("kind: Deployment\n", encoding="utf-8")
+    kubectl = tmp_path / "kubectl"
+    kubectl.write_text(f"#!/bin/sh\necho 'error validating \"{manifest_b}\"' >&2\nexit 1\n", encoding="utf-8")
+    kubectl.chmod(0o755)
+
+    result = KubernetesDeployer(kubectl_path=str(kubectl)).deploy(tmp_path / "project")
+
+    assert result.applied is False
+    assert result.message == f'kubectl failed for {manifest_b}: error validating "{manifest_b}"'
+    assert result.command_sequence == [
+        [str(kubectl), "apply", "-f", str(manifest_a), "-f", str(manifest_b)]
+    ]
+
+
+def test_list_manifests_keeps_dotfiles_and_skips_directories(tmp_root: Path) -> None:
+    from k8s_auto_dev_platform.deployer import _list_manifests
+
+    manifest_dir = _case_dir(tmp_root)
+    manifest_dir.mkdir()
+    for name in ("service.yaml", ".hidden.yaml", "deployment.yaml", "notes.txt"):
+        manifest_dir.joinpath(name).write_text("kind: Service\n", encoding="utf-8")
+    manifest_dir.joinpath("nested.yaml").mkdir()
+
+    assert _list_manifests(manifest_dir) == [
+        manifest_dir / ".hidden.yaml",
+        manifest_dir / "deployment.yaml",
+        manifest_dir / "service.yaml",
+    ]
+    assert _list_manifests(manifest_dir / "missing") == []
+
+
+def _yaml_spec(tmp_root: Path, extra: str = "") -> Path:
+    pytest.importorskip("yaml")
+    tmp_path = _case_dir(tmp_root)
+    tmp_path.mkdir()
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("service_name: Orders\ndescription: Order service.\n" + extra, encoding="utf-8")
+    return spec_path
+
+
+def test_yaml_cache_is_written_and_reused(tmp_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from k8s_auto_dev_platform.cli import _load_requirements
+
+    monkeypatch.setenv("K8S_AUTODEV_CACHE", "1")
+    spec_path = _yaml_spec(tmp_root)
+    cache_path = spec_path.with_name("spec.yaml.cache.json")
+
+    assert _load_requirements(spec_path) == {"service_name": "Orders", "description": "Order service."}
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["service_name"] == "Orders"
+
+    # A cache entry that is not older than the YAML is returned without parsing it.
+    cache_path.write_text('{"service_name": "Cached"}', encoding="utf-8")
+    stat = spec_path.stat()
+    os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _load_requirements(spec_path) == {"service_name": "Cached"}
+
+
+def test_yaml_cache_is_bypassed_when_yaml_is_newer(tmp_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from k8s_auto_dev_platform.cli import _load_requirements
+
+    monkeypatch.setenv("K8S_AUTODEV_CACHE", "1")
+    spec_path = _yaml_spec(tmp_root)
+    cache_path = spec_path.with_name("spec.yaml.cache.json")
+    cache_path.write_text('{"service_name": "Stale"}', encoding="utf-8")
+    stat = cache_path.stat()
+    os.utime(spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _load_requirements(spec_path)["service_name"] == "Orders"
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["service_name"] == "Orders"
+
+
+def test_yaml_cache_is_not_written_when_disabled(tmp_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from k8s_auto_dev_platform.cli import _load_requirements
+
+    monkeypatch.delenv("K8S_AUTODEV_CACHE", raising=False)
+    spec_path = _yaml_spec(tmp_root)
+
+    assert _load_requirements(spec_path)["service_name"] == "Orders"
+    assert not spec_path.with_name("spec.yaml.cache.json").exists()
+
+
+def test_yaml_cache_skips_documents_json_cannot_reproduce(
+    tmp_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from k8s_auto_dev_platform.cli import _load_requirements
+
+    monkeypatch.setenv("K8S_AUTODEV_CACHE", "1")
+    spec_path = _yaml_spec(tmp_root, "response:\n  1: one\n")
+
+    assert _load_requirements(spec_path)["response"] == {1: "one"}
+    assert not spec_path.with_name("spec.yaml.cache.json").exists()
+    assert _load_requirements(spec_path)["response"] == {1: "one"}